@@ -1,5 +1,7 @@
+import functools
 import math
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 
 from .glass_renderer import (
@@ -25,53 +27,114 @@ from .glass_renderer import (
 )
 
 
+TEXT_MAX_CHARS = 28
+TEXT_FONT_SIZE = 10
+BADGE_FONT_SIZE = 7.5
+# (size before SS scaling, bold) of every font the drawers ask font_func for
+FONT_SPECS = ((TEXT_FONT_SIZE, False), (BADGE_FONT_SIZE, True))
+_ELLIPSIS = "…"
+
+_DOT_COUNT = 10
+_DOT_OFFSETS = tuple(i - (_DOT_COUNT - 1) / 2 for i in range(_DOT_COUNT))
+
+_SPIN_COUNT = 8
+# Unit (cos, sin) of each spinner dot's resting angle; frames only rotate these
+_SPIN_UNIT = tuple(
+    (math.cos(2 * math.pi * i / _SPIN_COUNT), math.sin(2 * math.pi * i / _SPIN_COUNT))
+    for i in range(_SPIN_COUNT)
+)
+
+# (255, 255, 255, a) for every alpha, so per-frame fills are a tuple lookup
+_WHITE_A = tuple((255, 255, 255, a) for a in range(256))
+
+_BADGE_ON = (BADGE_ON_BG, BADGE_ON_FG, "→EN")
+_BADGE_OFF = (BADGE_OFF_BG, BADGE_OFF_FG, "자동")
+
+
+def clip_text(text, limit=TEXT_MAX_CHARS):
+    """Clip display text once, when it is set, rather than on every frame.
+    Only the visible slice is kept, so long transcripts never reach the renderer."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - len(_ELLIPSIS)] + _ELLIPSIS
+
+
+_RAMP = np.arange(256, dtype=np.float64)
+
+
+def scale_alpha(img, alpha):
+    """Multiply an RGBA image's alpha by ``alpha`` in place (truncating, as
+    int(p * alpha)), via a 256-entry table instead of a per-entry lambda."""
+    lut = (_RAMP * alpha).astype(np.uint8).tolist()
+    img.putalpha(img.getchannel("A").point(lut))
+
+
+# Off-screen Draw used only for measuring; textbbox depends on the mode
+_MEASURE = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+
+@functools.lru_cache(maxsize=64)
+def _text_bbox(font, text):
+    """draw.textbbox((0, 0), text) for the RGBA canvases, memoized so
+    static labels aren't re-laid out per frame. Goes through textbbox
+    rather than font.getbbox so multi-line error text is measured the
+    way draw.text lays it out."""
+    return _MEASURE.textbbox((0, 0), text, font=font)
+
+
 def downsample_levels(raw, points=WAVE_POINTS):
+    """Average ``raw`` into ``points`` equal chunks (leftover tail samples
+    are ignored); shorter inputs are zero-padded instead."""
+    raw = np.asarray(raw, dtype=np.float64)
     n = len(raw)
-    chunk = max(1, n // points)
-    out = []
-    for i in range(points):
-        start = i * chunk
-        end = min(start + chunk, n)
-        out.append(sum(raw[start:end]) / max(1, end - start) if start < end else 0.0)
-    return out
+    if n < points:
+        out = np.zeros(points)
+        out[:n] = raw
+        return out
+    chunk = n // points
+    return raw[: points * chunk].reshape(points, chunk).mean(axis=1)
 
 
 def draw_dots(draw, s, cx, cy, alpha=1.0):
-    count, sp = 10, 14 * s
-    sx = cx - (count - 1) * sp / 2
+    sp, r = 14 * s, 2.5 * s
     a = max(0, int(DOT_COLOR[3] * alpha))
     color = DOT_COLOR[:3] + (a,)
-    for i in range(count):
-        x, r = sx + i * sp, 2.5 * s
+    for off in _DOT_OFFSETS:
+        x = cx + off * sp
         draw.ellipse([x - r, cy - r, x + r, cy + r], fill=color)
 
 
-def draw_waveform(img, s, cx, cy, smooth, levels_func, alpha=1.0):
-    levels = levels_func()
-    ww = WAVE_WIDTH * s
-    sx = cx - ww / 2
-    step = ww / max(1, WAVE_POINTS - 1)
+@functools.lru_cache(maxsize=2)
+def _wave_tile(w, h):
+    """Reusable (image, draw) pair the waveform is rasterized into."""
+    img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    return img, ImageDraw.Draw(img)
+
 
-    for i in range(WAVE_POINTS):
-        smooth[i] = smooth[i] * 0.55 + levels[i] * 0.45  # tuned for ~60fps
+def draw_waveform(img, s, cx, cy, smooth, levels_func, alpha=1.0):
+    """Draw the level envelope; ``smooth`` is a float array updated in place."""
+    smooth *= 0.55  # tuned for ~60fps
+    smooth += np.asarray(levels_func(), dtype=np.float64) * 0.45
 
     # Skip drawing if no actual audio — prevents thin-band artifact on quick tap
-    if max(smooth) < 0.02:
+    if smooth.max() < 0.02:
         return smooth
 
-    avg = sum(smooth) / len(smooth)
-    t = min(1.0, avg * 2.5)
-
-    top, bot = [], []
-    for i in range(WAVE_POINTS):
-        x = sx + i * step
-        lv = max(smooth[i], 0.01)
-        h = (WAVE_MIN_H + lv * (WAVE_MAX_H - WAVE_MIN_H)) * s
-        top.append((x, cy - h))
-        bot.append((x, cy + h))
+    t = min(1.0, float(smooth.mean()) * 2.5)
 
-    wave_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    wd = ImageDraw.Draw(wave_layer)
+    # Draw and blur on a pill-sized tile; the envelope never leaves the pill
+    pad = PAD * s
+    tx, ty = cx - pad, cy - pad
+    ww = WAVE_WIDTH * s
+    step = ww / max(1, WAVE_POINTS - 1)
+    xs = (tx - ww / 2 + np.arange(WAVE_POINTS) * step).tolist()
+    h = (WAVE_MIN_H + np.maximum(smooth, 0.01) * (WAVE_MAX_H - WAVE_MIN_H)) * s
+    top = list(zip(xs, (ty - h).tolist()))
+    bot = list(zip(xs, (ty + h).tolist()))
+
+    box = (pad, pad, pad + PILL_W * s, pad + PILL_H * s)
+    wave_layer, wd = _wave_tile(box[2] - pad, box[3] - pad)
+    wave_layer.paste((0, 0, 0, 0), (0, 0) + wave_layer.size)
     poly = top + bot[::-1]
     if len(poly) >= 3:
         wd.polygon(poly, fill=_lerp(WAVE_FILL_LO, WAVE_FILL_HI, t))
@@ -79,25 +142,23 @@ def draw_waveform(img, s, cx, cy, smooth, levels_func, alpha=1.0):
     wave_layer = wave_layer.filter(ImageFilter.GaussianBlur(max(1, int(0.6 * s))))
 
     if alpha < 1.0:
-        wa = wave_layer.split()[3]
-        wa = wa.point(lambda p: int(p * alpha))
-        wave_layer.putalpha(wa)
+        scale_alpha(wave_layer, alpha)
 
-    result = Image.alpha_composite(img, wave_layer)
-    img.paste(result, (0, 0))
+    img.alpha_composite(wave_layer, dest=box[:2])
     return smooth
 
 
 def draw_spinner(draw, s, cx, cy, ai, alpha=1.0):
-    n, rad = 8, 10 * s
-    for i in range(n):
-        angle = (2 * math.pi * i / n) - (ai * 0.35)
-        x = cx + rad * math.cos(angle)
-        y = cy + rad * math.sin(angle)
+    n, rad = _SPIN_COUNT, 10 * s
+    # Rotate every dot by -ai*0.35: one cos/sin pair per frame
+    rc, rs = rad * math.cos(ai * 0.35), rad * math.sin(ai * 0.35)
+    for i, (uc, us) in enumerate(_SPIN_UNIT):
+        x = cx + uc * rc + us * rs
+        y = cy + us * rc - uc * rs
         bright = ((i + ai) % n) / n
         r = (1.5 + bright * 2) * s
         a = int((25 + bright * 210) * alpha)
-        draw.ellipse([x - r, y - r, x + r, y + r], fill=(255, 255, 255, a))
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=_WHITE_A[a])
 
 
 def draw_text(draw, s, cx, cy, text, state, font_func, alpha=1.0):
@@ -113,37 +174,51 @@ def draw_text(draw, s, cx, cy, text, state, font_func, alpha=1.0):
     )
 
     txt = text
-    if len(txt) > 28:
-        txt = txt[:25] + "..."
     base = COLOR_RESULT if state == "result" else COLOR_ERROR
     color = base[:3] + (max(0, int(base[3] * alpha)),)
-    font = font_func(int(10 * s), bold=False)
-    bb = draw.textbbox((0, 0), txt, font=font)
+    font = font_func(int(TEXT_FONT_SIZE * s), bold=False)
+    bb = _text_bbox(font, txt)
     tw, th = bb[2] - bb[0], bb[3] - bb[1]
     draw.text((cx - tw / 2, cy - th / 2 - bb[1]), txt, fill=color, font=font)
 
 
-def draw_badge(draw, s, mode, font_func, alpha=1.0):
-    bx = (PAD + PILL_W - 34) * s
-    by = (PAD + PILL_H / 2) * s
+def draw_badge(draw, s, mode, font_func, alpha=1.0, origin=(0, 0)):
+    ox, oy = origin
+    bx = (PAD + PILL_W - 34) * s - ox
+    by = (PAD + PILL_H / 2) * s - oy
     bw, bh, r = 30 * s, 16 * s, 5 * s
     x1, y1 = bx - bw / 2, by - bh / 2
     x2, y2 = bx + bw / 2, by + bh / 2
 
-    if mode == "translate":
-        bg, fg, label = BADGE_ON_BG, BADGE_ON_FG, "→EN"
-    else:
-        bg, fg, label = BADGE_OFF_BG, BADGE_OFF_FG, "자동"
+    bg, fg, label = _BADGE_ON if mode == "translate" else _BADGE_OFF
 
     bgc = bg[:3] + (max(0, int(bg[3] * alpha)),)
     fgc = fg[:3] + (max(0, int(fg[3] * alpha)),)
     draw.rounded_rectangle([x1, y1, x2, y2], radius=r, fill=bgc)
-    font = font_func(int(7.5 * s), bold=True)
-    bb = draw.textbbox((0, 0), label, font=font)
+    font = font_func(int(BADGE_FONT_SIZE * s), bold=True)
+    bb = _text_bbox(font, label)
     tw, th = bb[2] - bb[0], bb[3] - bb[1]
     draw.text((bx - tw / 2, by - th / 2 - bb[1]), label, fill=fgc, font=font)
 
 
+def render_badge(s, mode, font_func):
+    """Pre-render the mode badge once for reuse across frames.
+
+    Returns (sprite, mask, (x, y)); ``img.paste(sprite, (x, y), mask)`` gives
+    the same pixels as draw_badge, since ImageDraw replaces RGBA pixels
+    rather than blending and the badge shape is hard-edged.
+    """
+    bx = (PAD + PILL_W - 34) * s
+    by = (PAD + PILL_H / 2) * s
+    bw, bh = 30 * s, 16 * s
+    ox, oy = int(bx - bw / 2), int(by - bh / 2)
+    size = (math.ceil(bx + bw / 2) - ox + 1, math.ceil(by + bh / 2) - oy + 1)
+    sprite = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw_badge(ImageDraw.Draw(sprite), s, mode, font_func, origin=(ox, oy))
+    mask = sprite.getchannel("A").point(lambda v: 255 if v else 0)
+    return sprite, mask, (ox, oy)
+
+
 def draw_state_content(
     img,
     s,
@@ -156,8 +231,10 @@ def draw_state_content(
     levels_func,
     result_text,
     font_func,
+    draw=None,
 ):
-    draw = ImageDraw.Draw(img)
+    if draw is None:
+        draw = ImageDraw.Draw(img)
     if state == "idle":
         draw_dots(draw, s, cx, cy, alpha=alpha)
         return smooth
@@ -0,0 +1,16 @@
+import functools
+
+from PIL import ImageFont
+
+
+@functools.lru_cache(maxsize=32)
+def load_font(names, size):
+    """First of ``names`` (a tuple of font files) that loads at ``size``,
+    else Pillow's default font. Cached process-wide, so the overlay and
+    the tray share one FreeType face per (names, size)."""
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
@@ -1,3 +1,6 @@
+import functools
+
+import numpy as np
 from PIL import Image, ImageChops, ImageEnhance, ImageFilter, ImageGrab, ImageDraw
 
 PILL_W, PILL_H, PILL_R = 280, 40, 20
@@ -9,6 +12,7 @@ SS = 2
 
 REFRACTION_ZOOM = 0.10
 GLASS_BLUR = 18
+BLUR_DOWNSCALE = 4  # backdrop is blurred at 1/BLUR_DOWNSCALE resolution
 GLASS_SATURATION = 1.15
 GLASS_TINT = (255, 255, 255, 22)
 
@@ -51,16 +55,34 @@ def _lerp(a, b, t):
     return tuple(int(x + (y - x) * t) for x, y in zip(a, b))
 
 
-def capture_background(x, y, w, h):
+@functools.lru_cache(maxsize=4)
+def _fresnel_grad(pw, ph):
+    """Vertical edge-highlight falloff: bright at the top, 12% at the bottom."""
+    t = 1.0 - np.arange(ph) / ph
+    vals = ((0.12 + 0.88 * t**1.3) * 255).astype(np.uint8)
+    return Image.fromarray(np.repeat(vals[:, None], pw, axis=1), "L")
+
+
+def capture_background(x, y, w, h, grab=None):
+    """Blurred, slightly zoomed copy of the screen behind (x, y, w, h).
+    ``grab(x, y, w, h)`` supplies the pixels if given, else ImageGrab."""
     try:
-        img = ImageGrab.grab(bbox=(x, y, x + w, y + h))
+        if grab is not None:
+            img = grab(x, y, w, h)
+            if img is None:
+                return None
+        else:
+            img = ImageGrab.grab(bbox=(x, y, x + w, y + h))
         iw, ih = img.size
         mx = int(iw * REFRACTION_ZOOM / 2)
         my = int(ih * REFRACTION_ZOOM / 2)
         if mx > 0 and my > 0:
             img = img.crop((mx, my, iw - mx, ih - my))
-            img = img.resize((iw, ih), Image.LANCZOS)
-        img = img.filter(ImageFilter.GaussianBlur(radius=GLASS_BLUR))
+        # Blur at reduced resolution; the zoom crop is scaled by the same resize
+        f = BLUR_DOWNSCALE
+        small = img.resize((max(1, iw // f), max(1, ih // f)), Image.BILINEAR)
+        small = small.filter(ImageFilter.GaussianBlur(radius=GLASS_BLUR / f))
+        img = small.resize((iw, ih), Image.BILINEAR)
         img = ImageEnhance.Color(img).enhance(GLASS_SATURATION)
         return img
     except Exception:
@@ -82,7 +104,7 @@ def draw_glass_pill(img, bg_blur, s):
     sh_fill = Image.new("RGBA", (pw, ph), SHADOW_COLOR)
     shadow.paste(sh_fill, (pad, sh_y), pill_mask)
     shadow = shadow.filter(ImageFilter.GaussianBlur(int(SHADOW_BLUR * s)))
-    img.paste(Image.alpha_composite(img.copy(), shadow), (0, 0))
+    img.alpha_composite(shadow)
 
     if bg_blur:
         glass = bg_blur.resize((pw, ph), Image.LANCZOS).convert("RGBA")
@@ -100,9 +122,9 @@ def draw_glass_pill(img, bg_blur, s):
         fill=(255, 255, 255, 35),
     )
     glow = glow.filter(ImageFilter.GaussianBlur(int(5 * s)))
-    glow_full = Image.new("RGBA", (iw, ih), (0, 0, 0, 0))
-    glow_full.paste(glow, (pad, pad), pill_mask)
-    img.paste(Image.alpha_composite(img.copy(), glow_full), (0, 0))
+    masked_glow = Image.new("RGBA", (pw, ph), (0, 0, 0, 0))
+    masked_glow.paste(glow, (0, 0), pill_mask)
+    img.alpha_composite(masked_glow, dest=(pad, pad))
 
     edge = Image.new("RGBA", (pw, ph), (0, 0, 0, 0))
     ImageDraw.Draw(edge).rounded_rectangle(
@@ -111,18 +133,11 @@ def draw_glass_pill(img, bg_blur, s):
         outline=(255, 255, 255, 140),
         width=max(1, s),
     )
-    grad = Image.new("L", (pw, ph), 0)
-    for row in range(ph):
-        t = 1.0 - (row / ph)
-        val = int((0.12 + 0.88 * (t**1.3)) * 255)
-        grad.paste(val, (0, row, pw, row + 1))
     edge_alpha = edge.split()[3]
-    edge_alpha = ImageChops.multiply(edge_alpha, grad)
+    edge_alpha = ImageChops.multiply(edge_alpha, _fresnel_grad(pw, ph))
     edge.putalpha(edge_alpha)
 
-    edge_full = Image.new("RGBA", (iw, ih), (0, 0, 0, 0))
-    edge_full.paste(edge, (pad, pad))
-    img.paste(Image.alpha_composite(img.copy(), edge_full), (0, 0))
+    img.alpha_composite(edge, dest=(pad, pad))
 
 
 __all__ = [
@@ -136,6 +151,7 @@ __all__ = [
     "SS",
     "REFRACTION_ZOOM",
     "GLASS_BLUR",
+    "BLUR_DOWNSCALE",
     "GLASS_SATURATION",
     "GLASS_TINT",
     "SHADOW_COLOR",
@@ -1,21 +1,26 @@
 """Floating overlay renderer and state orchestrator."""
 
 import collections
-import ctypes
 import logging
 import queue
+import sys
 import threading
 import time
 import tkinter as tk
 import winsound
 
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageDraw
 
 # Request 1ms timer resolution for smooth animations on high-refresh monitors
-try:
-    _winmm = ctypes.WinDLL("winmm")
-except Exception:
-    _winmm = None
+_winmm = None
+if sys.platform == "win32":
+    import ctypes
+
+    try:
+        _winmm = ctypes.WinDLL("winmm")
+    except Exception:
+        pass
 
 from .animation import (
     ANIM_INTERVAL_MS,
@@ -26,7 +31,15 @@ from .animation import (
     MorphTransition,
     TransitionState,
 )
-from .content_drawers import downsample_levels, draw_badge, draw_state_content
+from .content_drawers import (
+    FONT_SPECS,
+    clip_text,
+    downsample_levels,
+    draw_state_content,
+    render_badge,
+    scale_alpha,
+)
+from .fonts import load_font
 from .glass_renderer import (
     AUTO_HIDE_MS,
     LEVEL_BUF,
@@ -41,27 +54,72 @@ from .glass_renderer import (
     draw_glass_pill,
 )
 from .sounds import _make_blip, _make_start_snd, _make_stop_snd
-from .win32_layer import LayeredWindow
+from .win32_layer import LayeredWindow, _premul_bgra
 
 logger = logging.getLogger(__name__)
 
+# Per-state (crossfade duration, hold ms before auto-returning to idle,
+# steady-state frame interval ms). The waveform smoothing is tuned for
+# ~60fps and the spinner for ~30fps; static states don't animate at all.
+STATE_STYLES = {
+    "idle": (TRANS_SLOW, None, None),
+    "recording": (TRANS_FAST, None, 16),
+    "processing": (TRANS_FAST, None, 33),
+    "result": (TRANS_MEDIUM, 3000, None),
+    "error": (TRANS_MEDIUM, 4000, None),
+}
+
+# Steady states drawn at 1x: the waveform is blurred anyway, so supersampling
+# buys nothing there. The spinner's hard-edged dots need SS to stay smooth.
+NATIVE_STATES = frozenset(("recording",))
+
+# Font files tried in order; Malgun Gothic covers the Korean result text
+BOLD_FONTS = ("malgunbd.ttf", "segoeuib.ttf")
+REGULAR_FONTS = ("malgun.ttf", "segoeui.ttf")
+
 
 class OverlayWindow:
-    def __init__(self):
+    def __init__(self, poll_min_ms=10, poll_max_ms=500):
         self._root = None
         self._thread = None
-        self._queue = queue.Queue()
+        # Bounded: if the UI thread stalls, the oldest commands are dropped
+        # (latest state wins). append/popleft are atomic under the GIL.
+        self._queue = collections.deque(maxlen=64)
         self._running = False
+        self._embedded = False  # True when hosted in the caller's Tk mainloop
+        self._loop_running = False  # set from inside mainloop; gates event posting
+        # Set by _cmd; _wake_worker turns it into <<OverlayCmd>> so callers
+        # never make the (blocking) cross-thread Tk call themselves
+        self._wake = threading.Event()
+        self._closed = False  # _do_quit has run; stop() can deliver quit twice
+        self._timer_period = False  # timeBeginPeriod(1) is in effect
         self._ready = threading.Event()
+        # Commands are delivered via <<OverlayCmd>>; the fallback poll backs
+        # off from poll_min_ms to poll_max_ms while idle
+        self._poll_min_ms = max(1, poll_min_ms)
+        self._poll_max_ms = max(self._poll_min_ms, poll_max_ms)
+        # Doublings of poll_min_ms needed to reach poll_max_ms
+        self._poll_max_shift = 0
+        while self._poll_min_ms << self._poll_max_shift < self._poll_max_ms:
+            self._poll_max_shift += 1
+        self._idle_polls = 0
+        self._last_cmd = ("", "")
+        # Bound once so _handle is a single dict lookup per command
+        self._handlers = {
+            cmd: (getattr(self, name), takes_data)
+            for cmd, (name, takes_data) in self._CMD_TABLE.items()
+        }
 
         self._mode = "transcribe"
         self._state = "idle"
         self._transition = TransitionState()
         self._morph = MorphTransition()
         self._is_mini = False
+        self._suspended = False  # session locked: nothing is visible, skip rendering
         self._ai = 0.0  # float: time-based spinner accumulator
         self._anim_id = None
         self._hide_id = None
+        self._last_activity = time.monotonic()
         self._result_id = None
         self._deferred_result_id = None
         self._result_text = ""
@@ -74,31 +132,77 @@ class OverlayWindow:
         self._win_x = self._win_y = 0
         self._bg_blur = None
         self._glass_cache = None
+        self._glass_bg = None  # backdrop the glass cache was built from
+        self._mini_cache = {}  # mode -> (dot sprite, packed BGRA), built lazily
+        self._badge_cache = {}  # mode -> (sprite, mask, pos) pasted each frame
+        self._scratch = None  # supersampled canvas reused by every full frame
+        self._scratch_draw = None
+        self._native = None  # 1x canvas for NATIVE_STATES frames
+        self._native_draw = None
+        self._native_bases = {}  # mode -> glass + badge prescaled to 1x
+        self._full_key = None  # what the last steady full frame showed
+        self._full_img = None
+        self._pushed = None  # (image, (x, y)) last handed to the layer
 
         self._layer = LayeredWindow()
-        self._font_cache = {}
-        self._audio_levels = collections.deque([0.0] * LEVEL_BUF, maxlen=LEVEL_BUF)
-        self._level_lock = threading.Lock()
-        self._smooth = [0.0] * WAVE_POINTS
+        self._preload_fonts()
+        # Single-producer ring written by the audio thread without a lock:
+        # slot writes and the index store are each atomic under the GIL, and a
+        # reader racing a write only sees one level a frame early or late.
+        self._levels = np.zeros(LEVEL_BUF)
+        self._levels_idx = 0  # total levels pushed; next slot is idx % LEVEL_BUF
+        self._smooth = np.zeros(WAVE_POINTS)
 
         self._wav_start = _make_start_snd()
         self._wav_stop = _make_stop_snd()
         self._wav_mode_on = _make_blip(880)
         self._wav_mode_off = _make_blip(520)
+        # Fire-and-forget cues go through one long-lived worker rather than a
+        # new thread per sound
+        self._snd_queue = queue.SimpleQueue()
+        threading.Thread(target=self._snd_worker, daemon=True).start()
+        threading.Thread(target=self._wake_worker, daemon=True).start()
 
     def start(self):
+        self.start_thread()
+
+    def start_thread(self):
+        """Run the overlay's own Tk mainloop on a background daemon thread."""
         if self._running:
             return
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
-        self._ready.wait(timeout=5)
+        if not self._ready.wait(timeout=1.0):
+            logger.warning("Overlay UI not ready after 1s; continuing without waiting")
+
+    def start_embedded(self, root=None):
+        """Run the overlay on the calling thread for apps that already use Tk.
+
+        The overlay becomes a Toplevel of ``root`` (or a new Tk root when None)
+        and the caller is responsible for running mainloop(). show_*/update_*
+        stay callable from any thread. Returns the Tk widget hosting the overlay.
+        """
+        if self._running:
+            return self._root
+        self._running = True
+        self._embedded = True
+        self._begin_timer_period()
+        self._init_tk(root)
+        self._ready.set()
+        return self._root
 
     def stop(self):
+        """Cooperative shutdown that never waits long on the UI thread."""
         self._running = False
-        self._cmd("quit")
+        self._cmd("quit")  # non-blocking; _wake_worker posts the event
+        if self._embedded:
+            return
+        # Should the event be missed, the next _poll (at most poll_max_ms
+        # away) sees _running == False and tears down; the daemon thread is
+        # reaped at exit if the UI thread is stuck.
         if self._thread:
-            self._thread.join(timeout=3)
+            self._thread.join(timeout=self._poll_max_ms / 1000 + 0.1)
 
     def show_idle(self):
         self._cmd("idle")
@@ -124,8 +228,9 @@ class OverlayWindow:
         self._cmd("move_monitor")
 
     def push_audio_level(self, level):
-        with self._level_lock:
-            self._audio_levels.append(max(0.0, min(1.0, level)))
+        i = self._levels_idx
+        self._levels[i % LEVEL_BUF] = max(0.0, min(1.0, level))
+        self._levels_idx = i + 1
 
     def play_start_sound(self):
         try:
@@ -134,57 +239,101 @@ class OverlayWindow:
             pass
 
     def play_stop_sound(self):
-        threading.Thread(
-            target=lambda: winsound.PlaySound(self._wav_stop, winsound.SND_MEMORY),
-            daemon=True,
-        ).start()
+        self._snd_queue.put(self._wav_stop)
+
+    def _snd_worker(self):
+        while True:
+            wav = self._snd_queue.get()
+            try:
+                winsound.PlaySound(wav, winsound.SND_MEMORY)
+            except Exception:
+                pass
+
+    def _preload_fonts(self):
+        """Load every renderer font and pre-render both mode badges, so the
+        first frames and the first mode toggle don't stall on disk I/O."""
+        for size, bold in FONT_SPECS:
+            self._get_font(int(size * SS), bold=bold)
+        for mode in ("transcribe", "translate"):
+            self._badge_cache[mode] = render_badge(SS, mode, self._get_font)
 
     def _get_font(self, size, bold=False):
-        key = (bold, size)
-        if key not in self._font_cache:
-            names = (
-                ("malgunbd.ttf", "segoeuib.ttf")
-                if bold
-                else ("malgun.ttf", "segoeui.ttf")
-            )
-            for name in names:
-                try:
-                    self._font_cache[key] = ImageFont.truetype(name, size)
-                    break
-                except Exception:
-                    continue
-            else:
-                self._font_cache[key] = ImageFont.load_default()
-        return self._font_cache[key]
+        return load_font(BOLD_FONTS if bold else REGULAR_FONTS, size)
 
     def _cmd(self, c, d=""):
-        try:
-            self._queue.put_nowait((c, d))
-        except queue.Full:
-            pass
+        """Queue a command; never blocks. Safe from any thread, including the
+        keyboard hook, which Windows unhooks if it stalls."""
+        self._queue.append((c, d))
+        self._wake.set()
+
+    def _wake_worker(self):
+        """Post <<OverlayCmd>> for queued commands. A cross-thread Tk call
+        waits until the UI thread services it, so only this thread ever
+        waits on a busy render."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()  # commands queued after this get a fresh wake
+            # Before mainloop spins, a cross-thread Tk call blocks for up to
+            # a second and then raises; leave the command for the startup drain.
+            root = self._root
+            if root is None or not self._loop_running:
+                continue
+            try:
+                root.event_generate("<<OverlayCmd>>", when="tail")
+            except Exception:
+                pass  # shutting down — _poll drains anything left
 
     def _run(self):
-        if _winmm:
-            _winmm.timeBeginPeriod(1)
+        self._begin_timer_period()
         try:
-            self._root = tk.Tk()
-            self._root.withdraw()
-            self._setup()
-            self._capture_desktop()
-            self._build_glass_cache()
-            self._root.deiconify()
-            self._make_layered()
-            self._render_and_push()
-            self._root.after(ANIM_INTERVAL_MS, self._poll)
-            self._start_hide()
-            self._ready.set()
+            self._init_tk()
             self._root.mainloop()
         except Exception as e:
             logger.error(f"Overlay error: {e}", exc_info=True)
             self._ready.set()
         finally:
-            if _winmm:
-                _winmm.timeEndPeriod(1)
+            self._end_timer_period()
+
+    def _init_tk(self, master=None):
+        self._root = tk.Toplevel(master) if master is not None else tk.Tk()
+        self._root.withdraw()
+        self._setup()
+        self._capture_desktop()
+        self._build_glass_cache()
+        self._root.deiconify()
+        self._make_layered()
+        self._render_and_push()
+        self._root.bind("<<OverlayCmd>>", lambda e: self._drain_queue())
+        self._root.after(self._poll_min_ms, self._poll)
+        self._root.after(0, self._on_loop_started)
+        self._start_hide()
+
+    def _on_loop_started(self):
+        self._loop_running = True
+        self._ready.set()
+        self._drain_queue()  # commands queued while Tk was initialising
+
+    def _close_tk(self):
+        """Leave our own mainloop, or destroy the Toplevel when embedded."""
+        if not self._embedded:
+            self._root.quit()
+            return
+        try:
+            self._root.destroy()
+        except tk.TclError:
+            pass  # already torn down
+        self._end_timer_period()
+
+    def _begin_timer_period(self):
+        if _winmm and not self._timer_period:
+            _winmm.timeBeginPeriod(1)
+            self._timer_period = True
+
+    def _end_timer_period(self):
+        """Undo _begin_timer_period, at most once per begin."""
+        if self._timer_period:
+            _winmm.timeEndPeriod(1)
+            self._timer_period = False
 
     def _setup(self):
         r = self._root
@@ -195,41 +344,113 @@ class OverlayWindow:
         self._sh = r.winfo_screenheight()
         self._mon_x = 0
         self._mon_y = 0
-        self._win_x = self._mon_x + (self._sw - WIN_W) // 2
-        self._win_y = self._mon_y + self._sh - WIN_H - 60
+        self._win_x, self._win_y = self._anchor()
         r.geometry(f"{WIN_W}x{WIN_H}+{self._win_x}+{self._win_y}")
+        # Apply override-redirect and geometry while still withdrawn so the
+        # first map happens once, undecorated, at the final position.
+        r.update_idletasks()
 
     def _make_layered(self):
         self._layer.setup_hwnd(self._root)
         self._layer.set_layered_style()
 
     def _capture_desktop(self):
-        self._bg_blur = capture_background(self._win_x, self._win_y, WIN_W, WIN_H)
+        self._bg_blur = capture_background(
+            self._win_x, self._win_y, WIN_W, WIN_H, grab=self._layer.grab_screen
+        )
 
     def _build_glass_cache(self):
+        bg = self._bg_blur
+        prev = self._glass_bg
+        if self._glass_cache is not None and (
+            bg is prev
+            or (
+                bg is not None
+                and prev is not None
+                and bg.size == prev.size
+                and bg.tobytes() == prev.tobytes()
+            )
+        ):
+            return  # backdrop unchanged — the cached pill is still valid
+        self._glass_bg = bg
+        self._full_key = None
+        self._native_bases.clear()
         s = SS
         img = Image.new("RGBA", (WIN_W * s, WIN_H * s), (0, 0, 0, 0))
         draw_glass_pill(img, self._bg_blur, s)
         self._glass_cache = img
 
-    def _push_image(self, pil_img):
-        self._layer.push_image(pil_img, self._win_x, self._win_y)
+    def _push_image(self, pil_img, bgra=None):
+        pos = (self._win_x, self._win_y)
+        last = self._pushed
+        if last is not None and last[0] is pil_img and last[1] == pos:
+            return  # same frame at the same place: the window already shows it
+        self._pushed = (pil_img, pos)
+        self._layer.push_image(pil_img, self._win_x, self._win_y, bgra)
 
     def _render_and_push(self):
-        img = self._render_mini() if self._is_mini else self._render_full()
-        self._push_image(img)
+        if self._is_mini:
+            self._push_image(*self._mini_sprite())
+        else:
+            self._push_image(self._render_full())
 
     def _render_full(self):
-        s = SS
-        img = (
-            self._glass_cache.copy()
-            if self._glass_cache
-            else Image.new("RGBA", (WIN_W * s, WIN_H * s), (0, 0, 0, 0))
-        )
+        ep = self._transition.update()
+        if not self._transition.active and self._state in NATIVE_STATES:
+            img, key = self._render_full_native(ep)
+            if key is not None and key == self._full_key:
+                return self._full_img
+            img = img.copy()  # the canvas is redrawn next frame
+        else:
+            img, key = self._render_full_super(ep)
+            if key is not None and key == self._full_key:
+                return self._full_img
+            # SS is an integer factor, so frames that are replaced within a
+            # few ms take a plain box reduce; keep LANCZOS for frames that
+            # stay on screen
+            moving = self._transition.active or STATE_STYLES[self._state][2]
+            img = img.reduce(SS) if moving else img.resize(
+                (WIN_W, WIN_H), Image.LANCZOS
+            )
+        self._full_key = key
+        self._full_img = img
+        return img
+
+    def _render_full_super(self, ep=None):
+        """Draw the full pill at SS resolution into the persistent canvas.
+        Returns (canvas, steady key); the key is None while animating."""
+        if ep is None:
+            ep = self._transition.update()
+        img = self._frame_canvas()
+        key = self._draw_content(img, self._scratch_draw, SS, ep)
+        self._paste_badge(img)
+        return img, key
+
+    def _render_full_native(self, ep):
+        """Draw the full pill at 1x over a prescaled glass+badge base, for
+        NATIVE_STATES. Returns (canvas, steady key) like _render_full_super."""
+        img = self._native
+        if img is None:
+            img = self._native = Image.new("RGBA", (WIN_W, WIN_H), (0, 0, 0, 0))
+            self._native_draw = ImageDraw.Draw(img)
+        img.paste(self._native_base(), (0, 0))
+        return img, self._draw_content(img, self._native_draw, 1, ep)
+
+    def _native_base(self):
+        base = self._native_bases.get(self._mode)
+        if base is None:
+            img = self._frame_canvas()
+            self._paste_badge(img)
+            # Same filter as the SS crossfade frames either side of it
+            base = img.reduce(SS)
+            self._native_bases[self._mode] = base
+        return base
+
+    def _draw_content(self, img, draw, s, ep):
+        """Draw the state content (crossfading if a transition is active) at
+        scale ``s``. Returns the steady key, or None mid-transition."""
         cx = (WIN_W / 2 - 14) * s
         cy = (PAD + PILL_H / 2) * s
-
-        ep = self._transition.update()
         if self._transition.active:
             self._smooth = draw_state_content(
                 img,
@@ -243,6 +464,7 @@ class OverlayWindow:
                 self._downsample_levels,
                 self._result_text,
                 self._get_font,
+                draw,
             )
             self._smooth = draw_state_content(
                 img,
@@ -256,26 +478,75 @@ class OverlayWindow:
                 self._downsample_levels,
                 self._result_text,
                 self._get_font,
+                draw,
             )
-        else:
-            self._smooth = draw_state_content(
-                img,
-                s,
-                cx,
-                cy,
-                self._state,
-                1.0,
-                self._ai,
-                self._smooth,
-                self._downsample_levels,
-                self._result_text,
-                self._get_font,
-            )
+            return None
+        self._smooth = draw_state_content(
+            img,
+            s,
+            cx,
+            cy,
+            self._state,
+            1.0,
+            self._ai,
+            self._smooth,
+            self._downsample_levels,
+            self._result_text,
+            self._get_font,
+            draw,
+        )
+        return self._steady_key()
 
-        draw_badge(ImageDraw.Draw(img), s, self._mode, self._get_font)
-        return img.resize((WIN_W, WIN_H), Image.LANCZOS)
+    def _paste_badge(self, img):
+        badge = self._badge_cache.get(self._mode)
+        if badge is None:
+            badge = self._badge_cache[self._mode] = render_badge(
+                SS, self._mode, self._get_font
+            )
+        sprite, mask, pos = badge
+        img.paste(sprite, pos, mask)
+
+    def _frame_canvas(self):
+        """The persistent supersampled canvas, reset to the bare glass pill."""
+        img = self._scratch
+        if img is None:
+            img = self._scratch = Image.new(
+                "RGBA", (WIN_W * SS, WIN_H * SS), (0, 0, 0, 0)
+            )
+            self._scratch_draw = ImageDraw.Draw(img)
+        if self._glass_cache:
+            img.paste(self._glass_cache, (0, 0))
+        else:
+            img.paste((0, 0, 0, 0), (0, 0) + img.size)
+        return img
+
+    def _steady_key(self):
+        """Everything a settled full frame depends on, or None if it changes
+        every frame anyway. Equal keys mean pixel-identical frames."""
+        state = self._state
+        if state == "idle":
+            detail = None
+        elif state == "recording":
+            # The waveform is not drawn at all until it rises above 0.02
+            detail = self._smooth.tobytes() if self._smooth.max() >= 0.02 else None
+        elif state in ("result", "error"):
+            detail = self._result_text
+        else:
+            return None  # spinner advances every tick
+        return (state, self._mode, detail)
 
     def _render_mini(self):
+        return self._mini_sprite()[0]
+
+    def _mini_sprite(self):
+        """(image, premultiplied BGRA) for the dot; it only depends on mode."""
+        sprite = self._mini_cache.get(self._mode)
+        if sprite is None:
+            img = self._build_mini()
+            sprite = self._mini_cache[self._mode] = (img, _premul_bgra(img))
+        return sprite
+
+    def _build_mini(self):
         s = 4
         sz = MINI_SIZE * s
         img = Image.new("RGBA", (sz, sz), (0, 0, 0, 0))
@@ -287,27 +558,25 @@ class OverlayWindow:
     def _render_morph(self, ep, cx, cy, cw, ch):
         """Render an intermediate frame during mini↔full morphing.
         Uses BILINEAR for speed during animation (LANCZOS only on final frame)."""
+        self._pushed = None
         if self._is_mini:
             # Shrinking: full → mini. Render full pill, scale down, fade to dot.
-            full_img = self._render_full()
             if cw > 0 and ch > 0:
-                morph_img = full_img.resize((cw, ch), Image.BILINEAR)
+                # One BILINEAR pass straight from SS; no native-size LANCZOS
+                morph_img = self._render_full_super()[0].resize(
+                    (cw, ch), Image.BILINEAR
+                )
                 # Fade out the pill as it shrinks
                 alpha_mult = 1.0 - ep
                 if alpha_mult < 1.0:
-                    a = morph_img.split()[3]
-                    a = a.point(lambda p: int(p * alpha_mult))
-                    morph_img.putalpha(a)
+                    scale_alpha(morph_img, alpha_mult)
                 # Blend with mini dot fading in
                 mini_img = self._render_mini()
-                canvas = Image.new("RGBA", (cw, ch), (0, 0, 0, 0))
-                canvas = Image.alpha_composite(canvas, morph_img)
+                canvas = morph_img  # fresh from resize(), safe to paste into
                 if ep > 0.3:
                     dot_alpha = min(1.0, (ep - 0.3) / 0.7)
                     dot = mini_img.copy()
-                    da = dot.split()[3]
-                    da = da.point(lambda p: int(p * dot_alpha))
-                    dot.putalpha(da)
+                    scale_alpha(dot, dot_alpha)
                     dx = (cw - MINI_SIZE) // 2
                     dy = (ch - MINI_SIZE) // 2
                     canvas.paste(dot, (max(0, dx), max(0, dy)), dot)
@@ -315,12 +584,11 @@ class OverlayWindow:
         else:
             # Expanding: mini → full. Start from dot, morph to full pill.
             if cw > 0 and ch > 0:
-                full_img = self._render_full()
-                morph_img = full_img.resize((cw, ch), Image.BILINEAR)
+                morph_img = self._render_full_super()[0].resize(
+                    (cw, ch), Image.BILINEAR
+                )
                 if ep < 1.0:
-                    a = morph_img.split()[3]
-                    a = a.point(lambda p: int(p * ep))
-                    morph_img.putalpha(a)
+                    scale_alpha(morph_img, ep)
                 self._layer.push_image(morph_img, cx, cy)
 
     def _finalize_morph(self):
@@ -336,45 +604,105 @@ class OverlayWindow:
             self._render_and_push()
 
     def _downsample_levels(self):
-        with self._level_lock:
-            raw = list(self._audio_levels)
+        raw = np.roll(self._levels, -(self._levels_idx % LEVEL_BUF))  # oldest first
         return downsample_levels(raw, WAVE_POINTS)
 
+    def _drain_queue(self):
+        """Handle all pending commands. Returns True if any were handled."""
+        pending = []
+        q = self._queue
+        while q:
+            pending.append(q.popleft())
+        for c, d in self._coalesce(pending):
+            self._handle(c, d)
+        return bool(pending)
+
+    @staticmethod
+    def _coalesce(cmds):
+        """Fold a burst of commands into the minimal equivalent sequence: the
+        latest monitor move, mode and state, in their original relative order.
+        An error is not displaced by a later result in the same burst."""
+        latest = {}
+        for i, (c, d) in enumerate(cmds):
+            if c == "quit":
+                return [(c, d)]
+            if c in ("move_monitor", "mode"):
+                latest[c] = (i, c, d)
+            elif not (c == "result" and latest.get("state", (0, ""))[1] == "error"):
+                latest["state"] = (i, c, d)
+        return [(c, d) for _, c, d in sorted(latest.values())]
+
     def _poll(self):
+        """Safety-net poll for commands whose <<OverlayCmd>> event was missed."""
         if not self._running:
-            self._root.quit()
+            self._do_quit()
             return
-        try:
-            while True:
-                c, d = self._queue.get_nowait()
-                self._handle(c, d)
-        except queue.Empty:
-            pass
-        self._root.after(ANIM_INTERVAL_MS, self._poll)
+        handled = self._drain_queue()
+        if handled:
+            self._idle_polls = 0
+        elif self._idle_polls < self._poll_max_shift:
+            self._idle_polls += 1
+        delay = self._poll_min_ms << self._idle_polls
+        self._root.after(min(self._poll_max_ms, delay), self._poll)
+
+    # Commands whose exact repeat changes nothing visible
+    _COALESCED_CMDS = frozenset(("idle", "recording", "processing", "mode"))
+
+    # cmd -> (handler method name, whether it takes the command's data)
+    _CMD_TABLE = {
+        "quit": ("_do_quit", False),
+        "idle": ("_set_idle", False),
+        "recording": ("_set_recording", False),
+        "processing": ("_set_processing", False),
+        "result": ("_set_result", True),
+        "error": ("_set_error", True),
+        "mode": ("_set_mode", True),
+        "move_monitor": ("_move_to_monitor", False),
+    }
 
     def _handle(self, cmd, data):
-        handlers = {
-            "quit": lambda: (setattr(self, "_running", False), self._root.quit()),
-            "idle": self._set_idle,
-            "recording": self._set_recording,
-            "processing": self._set_processing,
-            "result": lambda: self._set_result(data),
-            "error": lambda: self._set_error(data),
-            "mode": lambda: self._set_mode(data),
-            "move_monitor": self._move_to_monitor,
-        }
-        fn = handlers.get(cmd)
-        if fn:
+        if self._suspended:
+            self._sample_lock()  # a command after unlock must not wait for the poll
+        if cmd in self._COALESCED_CMDS and (cmd, data) == self._last_cmd:
+            return
+        self._last_cmd = (cmd, data)
+        entry = self._handlers.get(cmd)
+        if entry is None:
+            return
+        fn, takes_data = entry
+        if takes_data:
+            fn(data)
+        else:
             fn()
 
-    def _begin_transition(self, to_state, duration):
+    def _do_quit(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._running = False
+        self._loop_running = False
+        self._cancel_anim()
+        self._cancel_result()
+        self._cancel_deferred_result()
+        if self._hide_id:
+            try:
+                self._root.after_cancel(self._hide_id)
+            except Exception:
+                pass
+            self._hide_id = None
+        self._layer.close()
+        self._close_tk()
+
+    def _begin_transition(self, to_state, duration=None):
+        if duration is None:
+            duration = STATE_STYLES[to_state][0]
         self._transition.begin(self._state, to_state, duration)
         self._state = to_state
-        self._cancel_anim()
-        self._anim_tick()
+        self._request_frame()
 
     def _anim_tick(self):
-        if not self._running:
+        if not self._running or self._suspended:
+            self._anim_id = None
             return
         now = time.monotonic()
         dt = now - self._last_tick
@@ -382,45 +710,41 @@ class OverlayWindow:
         if self._state == "processing":
             self._ai += dt * 30.0  # equivalent to +1 per frame at original 30fps
 
-        if self._morph.active:
-            ep, (cx, cy, cw, ch) = self._morph.update()
+        morph = self._morph
+        if morph.active:
+            ep, (cx, cy, cw, ch) = morph.update()
             self._render_morph(ep, cx, cy, cw, ch)
-            if self._morph.active:
-                self._anim_id = self._root.after(ANIM_INTERVAL_MS, self._anim_tick)
-            else:
+            if not morph.active:
                 # Morph complete — finalize geometry
                 self._finalize_morph()
-                # Continue animation if content needs it
-                if self._transition.active or self._state in (
-                    "recording",
-                    "processing",
-                ):
-                    self._anim_id = self._root.after(ANIM_INTERVAL_MS, self._anim_tick)
-                else:
-                    self._anim_id = None
         else:
             self._render_and_push()
-            if self._transition.active or self._state in ("recording", "processing"):
-                self._anim_id = self._root.after(ANIM_INTERVAL_MS, self._anim_tick)
-            else:
-                self._anim_id = None
+
+        delay = self._frame_interval()
+        self._anim_id = self._root.after(delay, self._anim_tick) if delay else None
+
+    def _frame_interval(self):
+        """Delay until the next frame in ms, or None when nothing animates.
+        Geometry morphs and crossfades run at ANIM_INTERVAL_MS; steady animated
+        states use their own cadence from STATE_STYLES."""
+        if self._morph.active or self._transition.active:
+            return ANIM_INTERVAL_MS
+        return STATE_STYLES[self._state][2]
 
     def _set_idle(self):
         self._cancel_result()
         self._cancel_deferred_result()
         self._ensure_full()
-        self._begin_transition("idle", TRANS_SLOW)
+        self._begin_transition("idle")
         self._start_hide()
 
     def _set_recording(self):
         self._cancel_result()
         self._cancel_deferred_result()
         self._ensure_full()
-        with self._level_lock:
-            self._audio_levels.clear()
-            self._audio_levels.extend([0.0] * LEVEL_BUF)
-        self._smooth = [0.0] * WAVE_POINTS
-        self._begin_transition("recording", TRANS_FAST)
+        self._levels.fill(0.0)
+        self._smooth.fill(0.0)
+        self._begin_transition("recording")
 
     def _set_processing(self):
         self._cancel_result()
@@ -428,12 +752,12 @@ class OverlayWindow:
         self._ensure_full()
         self._ai = 0.0
         self._processing_start = time.monotonic()
-        self._begin_transition("processing", TRANS_FAST)
+        self._begin_transition("processing")
 
     _MIN_PROCESSING_DISPLAY = 0.35  # seconds — minimum spinner visibility
 
     def _set_result(self, text):
-        self._result_text = text
+        text = clip_text(text)
         self._cancel_result()
         self._cancel_deferred_result()
 
@@ -454,27 +778,28 @@ class OverlayWindow:
         """Actually display result. Guarded by generation token to prevent stale results."""
         if gen != self._result_gen:
             return  # stale deferred callback — a new recording started
-        self._result_text = text
-        self._ensure_full()
-        self._begin_transition("result", TRANS_MEDIUM)
-        self._result_id = self._root.after(3000, self._set_idle)
+        self._show_text("result", text)
 
     def _set_error(self, msg):
-        self._result_text = msg
         self._cancel_result()
         self._cancel_deferred_result()
+        self._show_text("error", clip_text(msg))
+
+    def _show_text(self, state, text):
+        """Show result/error text; an identical repeat only re-arms the timeout."""
+        same = state == self._state and text == self._result_text
+        self._result_text = text
         self._ensure_full()
-        self._begin_transition("error", TRANS_MEDIUM)
-        self._result_id = self._root.after(4000, self._set_idle)
+        if not same:
+            self._begin_transition(state)
+        hold_ms = STATE_STYLES[state][1]
+        self._result_id = self._root.after(hold_ms, self._set_idle)
 
     def _set_mode(self, mode):
         self._mode = mode
         self._ensure_full()
         wav = self._wav_mode_on if mode == "translate" else self._wav_mode_off
-        threading.Thread(
-            target=lambda: winsound.PlaySound(wav, winsound.SND_MEMORY),
-            daemon=True,
-        ).start()
+        self._snd_queue.put(wav)
         self._result_text = "번역 ON" if mode == "translate" else "Transcribe"
         self._begin_transition("result", TRANS_FAST)
         self._cancel_result()
@@ -495,26 +820,33 @@ class OverlayWindow:
             return  # already on this monitor
         self._mon_x, self._mon_y = mx, my
         self._sw, self._sh = mw, mh
-        if self._is_mini:
-            self._win_x = mx + (mw - MINI_SIZE) // 2
-            self._win_y = my + mh - MINI_SIZE - 68
-            self._root.geometry(f"{MINI_SIZE}x{MINI_SIZE}+{self._win_x}+{self._win_y}")
-        else:
-            self._win_x = mx + (mw - WIN_W) // 2
-            self._win_y = my + mh - WIN_H - 60
-            self._root.geometry(f"{WIN_W}x{WIN_H}+{self._win_x}+{self._win_y}")
+        self._win_x, self._win_y = self._anchor(self._is_mini)
+        w, h = (MINI_SIZE, MINI_SIZE) if self._is_mini else (WIN_W, WIN_H)
+        self._root.geometry(f"{w}x{h}+{self._win_x}+{self._win_y}")
         self._capture_desktop()
         self._build_glass_cache()
-        self._render_and_push()
+        self._request_frame()
         logger.debug(f"Overlay moved to monitor at ({mx},{my}) {mw}x{mh}")
 
+    def _anchor(self, mini=False):
+        """Window origin for the full pill or mini dot, computed from the
+        cached monitor work area (refreshed only when the monitor changes)."""
+        if mini:
+            return (
+                self._mon_x + (self._sw - MINI_SIZE) // 2,
+                self._mon_y + self._sh - MINI_SIZE - 68,
+            )
+        return (
+            self._mon_x + (self._sw - WIN_W) // 2,
+            self._mon_y + self._sh - WIN_H - 60,
+        )
+
     def _to_full(self):
         if not self._is_mini:
             return
         self._is_mini = False
         # Capture glass for the full-size position before morphing
-        new_x = self._mon_x + (self._sw - WIN_W) // 2
-        new_y = self._mon_y + self._sh - WIN_H - 60
+        new_x, new_y = self._anchor()
         self._capture_desktop()
         self._build_glass_cache()
         from_rect = (self._win_x, self._win_y, MINI_SIZE, MINI_SIZE)
@@ -523,37 +855,62 @@ class OverlayWindow:
         # Set tkinter geometry to full size so HWND is large enough
         self._root.geometry(f"{WIN_W}x{WIN_H}+{new_x}+{new_y}")
         self._morph.begin(from_rect, to_rect, MORPH_DURATION)
-        self._cancel_anim()
-        self._anim_tick()
+        self._request_frame()
 
     def _to_mini(self):
-        if self._is_mini or self._state != "idle":
+        # No morph while locked: _anim_tick is paused and could not finish it
+        if self._is_mini or self._state != "idle" or self._suspended:
             return
         self._is_mini = True
-        new_x = self._mon_x + (self._sw - MINI_SIZE) // 2
-        new_y = self._mon_y + self._sh - MINI_SIZE - 68
+        new_x, new_y = self._anchor(mini=True)
         from_rect = (self._win_x, self._win_y, WIN_W, WIN_H)
         to_rect = (new_x, new_y, MINI_SIZE, MINI_SIZE)
         self._morph.begin(from_rect, to_rect, MORPH_DURATION)
-        self._cancel_anim()
-        self._anim_tick()
+        self._request_frame()
 
     def _ensure_full(self):
         if self._is_mini:
             self._to_full()
-        self._cancel_hide()
+        self._start_hide()
 
     def _start_hide(self):
-        self._cancel_hide()
-        self._hide_id = self._root.after(AUTO_HIDE_MS, self._to_mini)
+        """Mark activity; the idle checker shrinks to mini AUTO_HIDE_MS later."""
+        self._last_activity = time.monotonic()
+        if self._hide_id is None and self._root is not None:
+            self._hide_id = self._root.after(AUTO_HIDE_MS, self._check_idle)
+
+    _LOCK_POLL_MS = 500  # lock re-check interval while suspended
+    _IDLE_CHECK_MIN_MS = 500  # floor between idle checks; hiding may lag by this
+
+    def _check_idle(self):
+        """Single self-rescheduling auto-hide timer (no cancel/restart churn).
+        Also samples the session lock state so rendering pauses while locked.
+        Stops rescheduling once the overlay has shrunk to mini, but never while
+        suspended: this timer is what notices the unlock."""
+        if not self._running:
+            return
+        self._sample_lock()
+        remaining = AUTO_HIDE_MS - int((time.monotonic() - self._last_activity) * 1000)
+        if remaining <= 0:
+            if self._state == "idle" and not self._suspended:
+                # Shrunk and idle: go dormant until the next _start_hide
+                self._to_mini()
+                self._hide_id = None
+                return
+            remaining = AUTO_HIDE_MS
+        if self._suspended:
+            remaining = min(remaining, self._LOCK_POLL_MS)
+        self._hide_id = self._root.after(
+            max(self._IDLE_CHECK_MIN_MS, remaining), self._check_idle
+        )
 
-    def _cancel_hide(self):
-        if self._hide_id:
-            try:
-                self._root.after_cancel(self._hide_id)
-            except Exception:
-                pass
-            self._hide_id = None
+    def _sample_lock(self):
+        locked = self._layer.is_session_locked()
+        if locked != self._suspended:
+            self._suspended = locked
+            if not locked:
+                # Unlocked — repaint and resume any animation that was paused
+                self._request_frame()
 
     def _cancel_result(self):
         if self._result_id:
@@ -572,6 +929,13 @@ class OverlayWindow:
                 pass
             self._deferred_result_id = None
 
+    def _request_frame(self):
+        """Render on the next idle pass. Several requests made while handling
+        one command (monitor move, mini→full, state change) coalesce into a
+        single frame instead of each forcing its own render."""
+        self._cancel_anim()
+        self._anim_id = self._root.after_idle(self._anim_tick)
+
     def _cancel_anim(self):
         if self._anim_id:
             try:
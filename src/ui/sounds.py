@@ -1,43 +1,60 @@
+import functools
 import io
 import wave
 
 import numpy as np
 
+SR = 44100
 
-def _np_to_wav(data, sr=44100):
+
+def _np_to_wav(data, sr=SR):
+    pcm = np.multiply(data, 32767, dtype=np.float32)
+    np.clip(pcm, -32768, 32767, out=pcm)
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(sr)
-        wf.writeframes(np.clip(data * 32767, -32768, 32767).astype(np.int16).tobytes())
+        wf.writeframes(pcm.astype(np.int16))  # buffer protocol; no tobytes copy
     return buf.getvalue()
 
 
+def _decay_tone(out, t, freq, decay, vol):
+    """Write sin(2*pi*freq*t) * exp(-decay*t) * vol into ``out`` (float32)."""
+    env = np.multiply(t, -decay)
+    np.exp(env, out=env)
+    env *= vol
+    np.multiply(t, 2 * np.pi * freq, out=out)
+    np.sin(out, out=out)
+    out *= env
+
+
+def _two_tone(f1, k1, v1, f2, k2, v2, d=0.055, gap=0.015, sr=SR):
+    """Two decaying tones separated by a short silence, as one float32 buffer."""
+    n, g = int(sr * d), int(sr * gap)
+    t = np.linspace(0, d, n, False)
+    out = np.zeros(2 * n + g, np.float32)
+    _decay_tone(out[:n], t, f1, k1, v1)
+    _decay_tone(out[n + g :], t, f2, k2, v2)
+    return out
+
+
+@functools.lru_cache(maxsize=None)
 def _make_start_snd():
-    sr, d = 44100, 0.055
-    t = np.linspace(0, d, int(sr * d), False)
-    w1 = np.sin(2 * np.pi * 660 * t) * np.exp(-t * 30) * 0.15
-    w2 = np.sin(2 * np.pi * 880 * t) * np.exp(-t * 30) * 0.15
-    return _np_to_wav(
-        np.concatenate([w1, np.zeros(int(sr * 0.015)), w2]).astype(np.float32)
-    )
+    return _np_to_wav(_two_tone(660, 30, 0.15, 880, 30, 0.15))
 
 
+@functools.lru_cache(maxsize=None)
 def _make_stop_snd():
-    sr, d = 44100, 0.055
-    t = np.linspace(0, d, int(sr * d), False)
-    w1 = np.sin(2 * np.pi * 880 * t) * np.exp(-t * 30) * 0.12
-    w2 = np.sin(2 * np.pi * 580 * t) * np.exp(-t * 35) * 0.10
-    return _np_to_wav(
-        np.concatenate([w1, np.zeros(int(sr * 0.015)), w2]).astype(np.float32)
-    )
+    return _np_to_wav(_two_tone(880, 30, 0.12, 580, 35, 0.10))
 
 
+@functools.lru_cache(maxsize=None)
 def _make_blip(freq, dur=0.06, vol=0.12):
-    sr = 44100
-    t = np.linspace(0, dur, int(sr * dur), False)
-    e = np.exp(-t * 40)
-    d = np.sin(2 * np.pi * freq * t) * e * vol
-    d += np.sin(2 * np.pi * freq * 1.5 * t) * e * vol * 0.3
-    return _np_to_wav(d.astype(np.float32))
+    t = np.linspace(0, dur, int(SR * dur), False)
+    env = np.exp(-t * 40)
+    env *= vol
+    d = np.sin(2 * np.pi * freq * t)
+    d += 0.3 * np.sin(2 * np.pi * freq * 1.5 * t)
+    d *= env
+    return _np_to_wav(d)
@@ -3,11 +3,14 @@ System tray icon module using pystray.
 Provides visual status indicator and quick settings access.
 """
 
+import functools
 import logging
 import threading
 from typing import Callable, Optional
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+
+from .fonts import load_font
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +22,13 @@ COLOR_TRANSLATE = (0, 120, 255)  # Blue - translate mode
 COLOR_ERROR = (255, 0, 0)  # Red - error
 
 
+@functools.lru_cache(maxsize=16)
 def create_icon_image(color: tuple, text: str = "V", size: int = 64) -> Image.Image:
-    """Create a simple colored icon with a letter."""
+    """Create a simple colored icon with a letter.
+
+    Memoized: there are only a handful of (color, text) pairs, and callers
+    hand the image to pystray without modifying it.
+    """
     image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(image)
 
@@ -34,10 +42,7 @@ def create_icon_image(color: tuple, text: str = "V", size: int = 64) -> Image.Im
     )
 
     # Draw text centered
-    try:
-        font = ImageFont.truetype("arial.ttf", size // 2)
-    except (OSError, IOError):
-        font = ImageFont.load_default()
+    font = load_font(("arial.ttf",), size // 2)
 
     bbox = draw.textbbox((0, 0), text, font=font)
     text_w = bbox[2] - bbox[0]
@@ -122,6 +127,8 @@ class SystemTray:
         Args:
             status: One of 'idle', 'listening', 'processing', 'error'
         """
+        if status == self._current_status:
+            return
         self._current_status = status
         self._refresh_icon()
 
@@ -132,6 +139,8 @@ class SystemTray:
         Args:
             mode: 'transcribe' or 'translate'
         """
+        if mode == self._current_mode:
+            return
         self._current_mode = mode
         self._refresh_icon()
 
@@ -1,6 +1,8 @@
 import ctypes
 import ctypes.wintypes as wt
 import logging
+import sys
+import threading
 
 import numpy as np
 from PIL import Image
@@ -16,9 +18,16 @@ ULW_ALPHA = 2
 AC_SRC_OVER = 0
 AC_SRC_ALPHA = 1
 MONITOR_DEFAULTTONEAREST = 2
+DESKTOP_SWITCHDESKTOP = 0x0100
+WTS_CURRENT_SESSION = 0xFFFFFFFF
+WTS_SESSION_INFO_EX = 25  # WTS_INFO_CLASS.WTSSessionInfoEx
+WTS_SESSIONSTATE_LOCK = 0
+WTS_SESSIONSTATE_UNLOCK = 1
+SRCCOPY = 0x00CC0020
 
 user32 = ctypes.WinDLL("user32", use_last_error=True)
 gdi32 = ctypes.WinDLL("gdi32", use_last_error=True)
+wtsapi32 = ctypes.WinDLL("wtsapi32", use_last_error=True)
 
 _PTR = ctypes.c_void_p
 
@@ -28,11 +37,19 @@ user32.GetParent.restype = _PTR
 user32.FindWindowW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p]
 user32.FindWindowW.restype = _PTR
 
-user32.GetWindowLongW.argtypes = [_PTR, ctypes.c_int]
-user32.GetWindowLongW.restype = ctypes.c_long
+# Window styles are LONG_PTR; 32-bit user32 only exports the LONG variants
+if ctypes.sizeof(ctypes.c_void_p) == 8:
+    _GetWindowLongPtr = user32.GetWindowLongPtrW
+    _SetWindowLongPtr = user32.SetWindowLongPtrW
+else:
+    _GetWindowLongPtr = user32.GetWindowLongW
+    _SetWindowLongPtr = user32.SetWindowLongW
 
-user32.SetWindowLongW.argtypes = [_PTR, ctypes.c_int, ctypes.c_long]
-user32.SetWindowLongW.restype = ctypes.c_long
+_GetWindowLongPtr.argtypes = [_PTR, ctypes.c_int]
+_GetWindowLongPtr.restype = ctypes.c_ssize_t
+
+_SetWindowLongPtr.argtypes = [_PTR, ctypes.c_int, ctypes.c_ssize_t]
+_SetWindowLongPtr.restype = ctypes.c_ssize_t
 
 user32.GetDC.argtypes = [_PTR]
 user32.GetDC.restype = _PTR
@@ -62,6 +79,12 @@ user32.MonitorFromWindow.restype = _PTR
 user32.GetMonitorInfoW.argtypes = [_PTR, ctypes.c_void_p]
 user32.GetMonitorInfoW.restype = wt.BOOL
 
+user32.OpenInputDesktop.argtypes = [wt.DWORD, wt.BOOL, wt.DWORD]
+user32.OpenInputDesktop.restype = _PTR
+
+user32.CloseDesktop.argtypes = [_PTR]
+user32.CloseDesktop.restype = wt.BOOL
+
 gdi32.CreateCompatibleDC.argtypes = [_PTR]
 gdi32.CreateCompatibleDC.restype = _PTR
 
@@ -84,6 +107,34 @@ gdi32.DeleteObject.restype = wt.BOOL
 gdi32.DeleteDC.argtypes = [_PTR]
 gdi32.DeleteDC.restype = wt.BOOL
 
+gdi32.BitBlt.argtypes = [
+    _PTR,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    ctypes.c_int,
+    _PTR,
+    ctypes.c_int,
+    ctypes.c_int,
+    wt.DWORD,
+]
+gdi32.BitBlt.restype = wt.BOOL
+
+gdi32.GdiFlush.argtypes = []
+gdi32.GdiFlush.restype = wt.BOOL
+
+wtsapi32.WTSQuerySessionInformationW.argtypes = [
+    _PTR,
+    wt.DWORD,
+    ctypes.c_int,
+    ctypes.POINTER(ctypes.c_void_p),
+    ctypes.POINTER(wt.DWORD),
+]
+wtsapi32.WTSQuerySessionInformationW.restype = wt.BOOL
+
+wtsapi32.WTSFreeMemory.argtypes = [ctypes.c_void_p]
+wtsapi32.WTSFreeMemory.restype = None
+
 
 class MONITORINFO(ctypes.Structure):
     _fields_ = [
@@ -119,11 +170,193 @@ class BITMAPINFOHEADER(ctypes.Structure):
     ]
 
 
-def _premultiply_alpha(img):
-    arr = np.array(img, dtype=np.uint16)
-    a = arr[:, :, 3:4]
-    arr[:, :, :3] = arr[:, :, :3] * a // 255
-    return Image.fromarray(arr.astype(np.uint8), "RGBA")
+class WTSINFOEX_LEVEL1_W(ctypes.Structure):
+    _fields_ = [
+        ("SessionId", wt.ULONG),
+        ("SessionState", ctypes.c_int),
+        ("SessionFlags", wt.LONG),
+        ("WinStationName", wt.WCHAR * 33),
+        ("UserName", wt.WCHAR * 21),
+        ("DomainName", wt.WCHAR * 18),
+        ("LogonTime", wt.LARGE_INTEGER),
+        ("ConnectTime", wt.LARGE_INTEGER),
+        ("DisconnectTime", wt.LARGE_INTEGER),
+        ("LastInputTime", wt.LARGE_INTEGER),
+        ("CurrentTime", wt.LARGE_INTEGER),
+        ("IncomingBytes", wt.DWORD),
+        ("OutgoingBytes", wt.DWORD),
+        ("IncomingFrames", wt.DWORD),
+        ("OutgoingFrames", wt.DWORD),
+        ("IncomingCompressedBytes", wt.DWORD),
+        ("OutgoingCompressedBytes", wt.DWORD),
+    ]
+
+
+class WTSINFOEXW(ctypes.Structure):
+    _fields_ = [("Level", wt.DWORD), ("Data", WTSINFOEX_LEVEL1_W)]
+
+
+# Windows 7 / Server 2008 R2 report WTSSessionInfoEx lock flags inverted
+_WTS_LOCK_INVERTED = sys.getwindowsversion()[:2] == (6, 1)
+
+
+def _wts_session_locked():
+    """Lock state of this session from WTSSessionInfoEx, or None if unknown.
+    A plain query: no window messages, no desktop handles."""
+    buf = ctypes.c_void_p()
+    size = wt.DWORD()
+    if not wtsapi32.WTSQuerySessionInformationW(
+        None,
+        WTS_CURRENT_SESSION,
+        WTS_SESSION_INFO_EX,
+        ctypes.byref(buf),
+        ctypes.byref(size),
+    ):
+        return None
+    try:
+        if size.value < ctypes.sizeof(WTSINFOEXW):
+            return None
+        info = WTSINFOEXW.from_address(buf.value)
+        flags = info.Data.SessionFlags if info.Level == 1 else -1
+    finally:
+        wtsapi32.WTSFreeMemory(buf)
+    if flags == WTS_SESSIONSTATE_LOCK:
+        return not _WTS_LOCK_INVERTED
+    if flags == WTS_SESSIONSTATE_UNLOCK:
+        return _WTS_LOCK_INVERTED
+    return None
+
+
+# Constant UpdateLayeredWindow arguments: per-pixel alpha at full source
+# opacity, always blitted from the bitmap origin.
+_BLEND = BLENDFUNCTION(AC_SRC_OVER, 0, 255, AC_SRC_ALPHA)
+_PT_SRC = wt.POINT(0, 0)
+
+
+# Optional: numba compiles the per-frame premultiply into a parallel loop.
+# Importing numba and compiling take seconds, so both happen on a background
+# thread (start_premul_jit); frames use the NumPy path until the kernel is
+# published here.
+_premul_bgra_nb = None
+_jit_thread = None
+
+
+def _build_premul_jit():
+    import numba
+
+    # TBB hangs at interpreter exit when its first parallel launch is on a
+    # non-main thread, as it is here; workqueue is always available and only
+    # the UI thread runs the kernel once it is published.
+    if numba.config.THREADING_LAYER == "default":
+        numba.config.THREADING_LAYER = "workqueue"
+
+    @numba.njit(parallel=True, cache=True)
+    def premul_bgra_nb(src, dst):
+        for i in numba.prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                a = np.int32(src[i, j, 3])
+                for c in range(3):
+                    t = src[i, j, 2 - c] * a + 128
+                    dst[i, j, c] = (t + (t >> 8)) >> 8
+                dst[i, j, 3] = a
+
+    src = np.zeros((2, 2, 4), np.uint8)
+    dst = np.empty((2, 3, 4), np.uint8)
+    premul_bgra_nb(src, dst[:, :2])  # strided, as for frames narrower than the DIB
+    premul_bgra_nb(src, dst[:, :2].copy())
+    return premul_bgra_nb
+
+
+def _warm_premul_jit():
+    """Compile the numba kernel and publish it; keep NumPy if numba is
+    missing or compilation fails (e.g. no writable cache directory in a
+    frozen build)."""
+    global _premul_bgra_nb
+    try:
+        kernel = _build_premul_jit()
+    except ImportError:
+        return
+    except Exception as e:
+        logger.warning(f"numba premultiply unavailable, using NumPy: {e}")
+        return
+    _premul_bgra_nb = kernel
+
+
+def start_premul_jit():
+    """Warm the numba kernel on a daemon thread, once per process."""
+    global _jit_thread
+    if _jit_thread is None:
+        _jit_thread = threading.Thread(target=_warm_premul_jit, daemon=True)
+        _jit_thread.start()
+
+
+_premul_scratch = np.empty((0, 0, 3), np.uint16)
+
+
+def _premul_u16(h, w):
+    """(h, w, 3) uint16 view of a grow-only scratch buffer for the NumPy
+    premultiply, so a frame doesn't allocate its intermediate."""
+    global _premul_scratch
+    sh, sw = _premul_scratch.shape[:2]
+    if h > sh or w > sw:
+        _premul_scratch = np.empty((max(h, sh), max(w, sw), 3), np.uint16)
+    return _premul_scratch[:h, :w]
+
+
+def _premul_bgra(img, out=None):
+    """Premultiplied BGRA pixels of an RGBA image, in the layout
+    UpdateLayeredWindow expects. Writes into ``out`` (which may be a strided
+    view, e.g. of the DIB) when its shape matches."""
+    src = np.asarray(img)
+    if out is None or out.shape != src.shape:
+        out = np.empty_like(src)
+    if _premul_bgra_nb is not None:
+        _premul_bgra_nb(src, out)
+        return out
+    # round(c * a / 255) without a division: t = c*a + 128; (t + (t >> 8)) >> 8
+    t = _premul_u16(*src.shape[:2])
+    np.multiply(src[:, :, 2::-1], src[:, :, 3:4], out=t, dtype=np.uint16)
+    t += 128
+    t += t >> 8
+    t >>= 8
+    out[:, :, :3] = t
+    out[:, :, 3] = src[:, :, 3]
+    return out
+
+
+def _create_dib(w, h):
+    """Top-down 32bpp DIB section selected into a new memory DC.
+    Returns (hdc_mem, hbmp, old_bmp, (h, w, 4) uint8 view) or None."""
+    hdc_scr = user32.GetDC(0)
+    hdc_mem = gdi32.CreateCompatibleDC(hdc_scr)
+
+    bmi = BITMAPINFOHEADER()
+    bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+    bmi.biWidth = w
+    bmi.biHeight = -h
+    bmi.biPlanes = 1
+    bmi.biBitCount = 32
+
+    ppv = ctypes.c_void_p()
+    hbmp = gdi32.CreateDIBSection(
+        hdc_scr, ctypes.byref(bmi), 0, ctypes.byref(ppv), None, 0
+    )
+    user32.ReleaseDC(0, hdc_scr)
+    if not hbmp:
+        logger.warning("CreateDIBSection failed")
+        gdi32.DeleteDC(hdc_mem)
+        return None
+
+    old = gdi32.SelectObject(hdc_mem, hbmp)
+    buf = (ctypes.c_uint8 * (w * h * 4)).from_address(ppv.value)
+    return hdc_mem, hbmp, old, np.frombuffer(buf, np.uint8).reshape(h, w, 4)
+
+
+def _free_dib(dib):
+    hdc_mem, hbmp, old, _ = dib
+    gdi32.SelectObject(hdc_mem, old)
+    gdi32.DeleteObject(hbmp)
+    gdi32.DeleteDC(hdc_mem)
 
 
 class LayeredWindow:
@@ -132,6 +365,12 @@ class LayeredWindow:
         self.win_x = 0
         self.win_y = 0
         self.ulw_warned = False
+        # One DIB selected into a memory DC for the window's lifetime. It is
+        # sized to the largest frame seen; smaller frames use its top-left.
+        self._dib = None  # _create_dib() result
+        self._dib_w = self._dib_h = 0
+        self._cap = None  # separate DIB that screen captures are blitted into
+        start_premul_jit()
 
     def setup_hwnd(self, root):
         root.update_idletasks()
@@ -157,12 +396,12 @@ class LayeredWindow:
     def set_layered_style(self):
         if not self.hwnd:
             return
-        style = user32.GetWindowLongW(self.hwnd, GWL_EXSTYLE)
+        style = _GetWindowLongPtr(self.hwnd, GWL_EXSTYLE)
         style |= WS_EX_LAYERED | WS_EX_TRANSPARENT | WS_EX_TOOLWINDOW | WS_EX_NOACTIVATE
-        ret = user32.SetWindowLongW(self.hwnd, GWL_EXSTYLE, style)
+        ret = _SetWindowLongPtr(self.hwnd, GWL_EXSTYLE, style)
         if not ret and style:
             logger.warning(
-                f"SetWindowLongW returned 0, last error: {ctypes.get_last_error()}"
+                f"SetWindowLongPtrW returned 0, last error: {ctypes.get_last_error()}"
             )
 
     @staticmethod
@@ -185,53 +424,96 @@ class LayeredWindow:
         except Exception:
             return None
 
-    def push_image(self, pil_img, win_x, win_y):
+    @staticmethod
+    def is_session_locked():
+        """True while the workstation is locked. Asks WTS for the session's
+        lock flag; if that is unavailable, falls back to whether the input
+        desktop can be opened, which fails while Winlogon's secure desktop
+        (the lock screen) has input."""
+        try:
+            locked = _wts_session_locked()
+            if locked is not None:
+                return locked
+            hdesk = user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+            if not hdesk:
+                return True
+            user32.CloseDesktop(hdesk)
+            return False
+        except Exception:
+            return False
+
+    def _ensure_dib(self, w, h):
+        if self._dib and w <= self._dib_w and h <= self._dib_h:
+            return True
+        w, h = max(w, self._dib_w), max(h, self._dib_h)
+        if self._dib:
+            _free_dib(self._dib)
+        self._dib = _create_dib(w, h)
+        if not self._dib:
+            return False
+        self._dib_w, self._dib_h = w, h
+        return True
+
+    def grab_screen(self, x, y, w, h):
+        """RGB image of a virtual-screen rectangle, or None. BitBlt writes
+        straight into a reused DIB section. Plain SRCCOPY, like ImageGrab's
+        default: layered windows (this overlay included) are left out."""
+        cap = self._cap
+        if not cap or cap[3].shape[:2] != (h, w):
+            if cap:
+                _free_dib(cap)
+            cap = self._cap = _create_dib(w, h)
+            if not cap:
+                return None
+        hdc_scr = user32.GetDC(0)
+        try:
+            ok = gdi32.BitBlt(cap[0], 0, 0, w, h, hdc_scr, x, y, SRCCOPY)
+        finally:
+            user32.ReleaseDC(0, hdc_scr)
+        if not ok:
+            return None
+        gdi32.GdiFlush()  # make sure the blit has landed before reading bits
+        return Image.frombuffer("RGB", (w, h), cap[3], "raw", "BGRX", 0, 1)
+
+    def close(self):
+        """Release the persistent DIB sections and memory DCs."""
+        for dib in (self._dib, self._cap):
+            if dib:
+                _free_dib(dib)
+        self._dib = self._cap = None
+
+    def push_image(self, pil_img, win_x, win_y, bgra=None):
+        """Show ``pil_img`` at (win_x, win_y). ``bgra`` may carry the image's
+        pixels already packed by _premul_bgra, e.g. for a cached sprite."""
         if not self.hwnd:
             return
 
         self.win_x = win_x
         self.win_y = win_y
-        pil_img = _premultiply_alpha(pil_img)
         w, h = pil_img.size
-        raw = pil_img.tobytes("raw", "BGRA")
-
-        hdc_scr = user32.GetDC(0)
-        hdc_mem = gdi32.CreateCompatibleDC(hdc_scr)
-
-        bmi = BITMAPINFOHEADER()
-        bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-        bmi.biWidth = w
-        bmi.biHeight = -h
-        bmi.biPlanes = 1
-        bmi.biBitCount = 32
-
-        ppv = ctypes.c_void_p()
-        hbmp = gdi32.CreateDIBSection(
-            hdc_scr, ctypes.byref(bmi), 0, ctypes.byref(ppv), None, 0
-        )
-        if not hbmp:
-            logger.warning("CreateDIBSection failed")
-            gdi32.DeleteDC(hdc_mem)
-            user32.ReleaseDC(0, hdc_scr)
+        if not self._ensure_dib(w, h):
             return
 
-        ctypes.memmove(ppv, raw, len(raw))
-        old = gdi32.SelectObject(hdc_mem, hbmp)
+        # Pixels go straight into the DIB; there is no intermediate buffer
+        dst = self._dib[3][:h, :w]
+        if bgra is None:
+            _premul_bgra(pil_img, dst)
+        else:
+            np.copyto(dst, bgra)
 
         sz = wt.SIZE(w, h)
-        pt_src = wt.POINT(0, 0)
         pt_dst = wt.POINT(self.win_x, self.win_y)
-        blend = BLENDFUNCTION(AC_SRC_OVER, 0, 255, AC_SRC_ALPHA)
 
+        # hdcDst may be NULL: the window is not changing palettes
         ok = user32.UpdateLayeredWindow(
             self.hwnd,
-            hdc_scr,
+            None,
             ctypes.byref(pt_dst),
             ctypes.byref(sz),
-            hdc_mem,
-            ctypes.byref(pt_src),
+            self._dib[0],
+            ctypes.byref(_PT_SRC),
             0,
-            ctypes.byref(blend),
+            ctypes.byref(_BLEND),
             ULW_ALPHA,
         )
         if not ok and not self.ulw_warned:
@@ -239,8 +521,3 @@ class LayeredWindow:
             logger.error(
                 f"UpdateLayeredWindow failed, last error: {ctypes.get_last_error()}"
             )
-
-        gdi32.SelectObject(hdc_mem, old)
-        gdi32.DeleteObject(hbmp)
-        gdi32.DeleteDC(hdc_mem)
-        user32.ReleaseDC(0, hdc_scr)